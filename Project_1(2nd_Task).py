@@ -1,83 +1,93 @@
 import json
 import os
+import sys
 
-class Student:
-    def __init__(self, name, student_id, grade):
-        self.name = name
-        self.student_id = student_id
-        self.grade = grade
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the json module
+    orjson = None
 
-    def to_dict(self):
-        return {
-            'name': self.name,
-            'id': self.student_id,
-            'grade': self.grade
-        }
-
-    @staticmethod
-    def from_dict(data):
-        return Student(data['name'], data['id'], data['grade'])
+_ROW_FMT = "{:<10} {:<20} {:<10}".format
 
 class StudentManager:
     def __init__(self, filename='students.json'):
         self.filename = filename
         self.students = self.load_students()
+        self.student_dict = {s['id']: s for s in self.students}
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
 
     def load_students(self):
         if not os.path.exists(self.filename):
             return []
-        with open(self.filename, 'r') as f:
+        with open(self.filename, 'rb') as f:
             try:
-                data = json.load(f)
-                return [Student.from_dict(s) for s in data]
+                data = f.read()
+                return orjson.loads(data) if orjson else json.loads(data)
             except json.JSONDecodeError:
                 return []
 
     def save_students(self):
-        with open(self.filename, 'w') as f:
-            json.dump([s.to_dict() for s in self.students], f, indent=2)
+        if orjson:
+            payload = orjson.dumps(self.students, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.students, indent=2).encode()
+        tmp = self.filename + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, self.filename)
+        self._dirty = False
+
+    def flush(self):
+        if self._dirty:
+            self.save_students()
 
     def add_student(self, name, student_id, grade):
-        if any(s.student_id == student_id for s in self.students):
+        if student_id in self.student_dict:
             print(f"Error: Student ID '{student_id}' already exists.")
             return False
-        student = Student(name, student_id, grade)
+        student = {'name': name, 'id': student_id, 'grade': grade}
         self.students.append(student)
-        self.save_students()
+        self.student_dict[student_id] = student
+        self._dirty = True
         print(f"Student '{name}' added.")
         return True
 
     def update_student(self, student_id, name=None, grade=None):
-        for s in self.students:
-            if s.student_id == student_id:
-                if name:
-                    s.name = name
-                if grade:
-                    s.grade = grade
-                self.save_students()
-                print(f"Student ID '{student_id}' updated.")
-                return True
-        print(f"Error: Student ID '{student_id}' not found.")
-        return False
+        student = self.student_dict.get(student_id)
+        if not student:
+            print(f"Error: Student ID '{student_id}' not found.")
+            return False
+        if name:
+            student['name'] = name
+        if grade:
+            student['grade'] = grade
+        self._dirty = True
+        print(f"Student ID '{student_id}' updated.")
+        return True
 
     def delete_student(self, student_id):
-        for i, s in enumerate(self.students):
-            if s.student_id == student_id:
-                del self.students[i]
-                self.save_students()
-                print(f"Student ID '{student_id}' deleted.")
-                return True
-        print(f"Error: Student ID '{student_id}' not found.")
-        return False
+        student = self.student_dict.pop(student_id, None)
+        if not student:
+            print(f"Error: Student ID '{student_id}' not found.")
+            return False
+        self.students.remove(student)
+        self._dirty = True
+        print(f"Student ID '{student_id}' deleted.")
+        return True
 
     def list_students(self):
         if not self.students:
             print("No student records found.")
             return
-        print("{:<10} {:<20} {:<10}".format("ID", "Name", "Grade"))
-        print("-"*40)
-        for s in self.students:
-            print("{:<10} {:<20} {:<10}".format(s.student_id, s.name, s.grade))
+        out = [_ROW_FMT("ID", "Name", "Grade"), "-"*40]
+        out.extend(_ROW_FMT(s['id'], s['name'], s['grade']) for s in self.students)
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -110,6 +120,7 @@ def main():
             break
         else:
             print("Invalid option. Try again.")
+        manager.flush()
 
 if __name__ == "__main__":
     main()
@@ -5,11 +5,38 @@ Converts CSV files to Excel format with data cleaning, normalization, and error
 
 import pandas as pd
 import argparse
+import contextlib
+import io
 import logging
+import math
+import re
+import stat
 import sys
+import zipfile
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional, Dict
+from xml.sax.saxutils import escape, quoteattr
 import json
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from openpyxl.workbook.child import INVALID_TITLE_REGEX
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the pandas parser
+    pa = pa_csv = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the json module
+    orjson = None
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # public from pandas 2.2; older versions guess inside to_datetime
+    guess_datetime_format = None
 
 # Configure logging
 logging.basicConfig(
@@ -18,12 +45,207 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Cheap prefilter for auto date detection: only columns whose sampled values
+# look like YYYY-MM-DD / MM/DD/YYYY style dates are handed to pd.to_datetime
+DATE_PATTERN = re.compile(r'\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}')
+DATE_SAMPLE_SIZE = 50
+DATE_MATCH_RATIO = 0.5
+# Formats tried against a sample of each date column; the first one that fits
+# every sampled value is passed to pd.to_datetime so it can use the fast parser
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y/%m/%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%m/%d/%Y %H:%M:%S',
+    '%d-%m-%Y',
+    '%d-%m-%Y %H:%M:%S',
+    '%d.%m.%Y',
+)
+
+# Deduplicating on every column of a wide table hashes far more than needed
+WIDE_TABLE_COLUMNS = 20
+
+EXCEL_ENGINES = ('openpyxl', 'fast_xml')
+# Rows boxed to Python objects at a time while exporting, so the export
+# never holds an object copy of the whole frame
+EXPORT_SLICE_ROWS = 10000
+# Excel refuses to open workbooks with longer sheet names
+MAX_SHEET_NAME_LENGTH = 31
+
+# Minimal SpreadsheetML parts for the 'fast_xml' engine, which writes the
+# xlsx package directly instead of going through openpyxl Cell objects
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name={name} sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+# Style 1 is the date/time number format used for datetime cells
+_XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd h:mm:ss"/></numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+)
+_XLSX_SHEET_END = '</sheetData></worksheet>'
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+# Control characters that are not allowed anywhere in an XML document
+_ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _xml_text_cell(value) -> str:
+    """Format a value as an inline string cell."""
+    text = escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xml_number_cell(value) -> str:
+    """Format a number cell; NaN and infinity become empty cells."""
+    if not math.isfinite(value):
+        return '<c/>'
+    return f'<c><v>{value}</v></c>'
+
+
+def _xml_datetime_cell(value) -> str:
+    """Format a date/datetime as an Excel serial number with a date style."""
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    serial = (value.replace(tzinfo=None) - _EXCEL_EPOCH).total_seconds() / 86400
+    return f'<c s="1"><v>{serial}</v></c>'
+
+
+_XML_CELL_WRITERS = {
+    str: _xml_text_cell,
+    int: _xml_number_cell,
+    float: _xml_number_cell,
+    bool: lambda value: f'<c t="b"><v>{int(value)}</v></c>',
+    type(None): lambda value: '<c/>',
+}
+
+
+def _xml_cell(value) -> str:
+    """Format a single worksheet cell for the 'fast_xml' engine."""
+    writer = _XML_CELL_WRITERS.get(type(value))
+    if writer is not None:
+        return writer(value)
+    if isinstance(value, bool):
+        return _XML_CELL_WRITERS[bool](value)
+    if isinstance(value, (int, float)):
+        return _xml_number_cell(value)
+    if isinstance(value, (datetime, date)):
+        return _xml_datetime_cell(value)
+    return _xml_text_cell(value)
+
+
+def _xml_sheet_views(freeze_panes: tuple) -> str:
+    """Build the sheetViews element that freezes the given (row, col)."""
+    rows, cols = freeze_panes
+    if not rows and not cols:
+        return ''
+    if rows and cols:
+        active_pane = 'bottomRight'
+    elif rows:
+        active_pane = 'bottomLeft'
+    else:
+        active_pane = 'topRight'
+    splits = (f' xSplit="{cols}"' if cols else '') + (f' ySplit="{rows}"' if rows else '')
+    top_left = f'{get_column_letter(cols + 1)}{rows + 1}'
+    return (
+        '<sheetViews><sheetView workbookViewId="0">'
+        f'<pane{splits} topLeftCell="{top_left}" activePane="{active_pane}" state="frozen"/>'
+        '</sheetView></sheetViews>'
+    )
+
+
+def _copy_on_write():
+    """
+    Enable Copy-on-Write for the duration of a conversion, so the transform
+    steps share buffers instead of copying, without changing the option for
+    the rest of the process. It is always on from pandas 3.0; the option
+    only exists from pandas 1.5.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return contextlib.nullcontext()
+    try:
+        pd.get_option('mode.copy_on_write')
+    except KeyError:
+        return contextlib.nullcontext()
+    return pd.option_context('mode.copy_on_write', True)
+
+
+def _dedupe_column_names(names: list) -> list:
+    """Name columns the way pd.read_csv does: blank headers become
+    'Unnamed: i' and repeats get '.1', '.2', ... suffixes."""
+    names = [name or f'Unnamed: {i}' for i, name in enumerate(names)]
+    original = set(names)
+    counts = {}
+    for i, name in enumerate(names):
+        base = name
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f'{base}.{count}'
+            # Skip suffixes that are already taken by a later header
+            count = count + 1 if name in original else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
 
 class CSVtoExcelConverter:
     """Handles CSV to Excel conversion with data cleaning and normalization."""
     
     def __init__(self, input_file: str, output_file: Optional[str] = None, 
-                 config_file: Optional[str] = None):
+                 config_file: Optional[str] = None, chunksize: Optional[int] = None,
+                 primary_key: Optional[list] = None):
         """
         Initialize the converter.
         
@@ -31,25 +253,41 @@ class CSVtoExcelConverter:
             input_file: Path to the input CSV file
             output_file: Path to the output Excel file (optional)
             config_file: Path to JSON config file for column renaming (optional)
+            chunksize: Stream the CSV in chunks of this many rows (optional)
+            primary_key: Columns that identify a row, used for deduplication (optional)
         """
         self.input_file = Path(input_file)
         self.output_file = Path(output_file) if output_file else None
         self.config_file = Path(config_file) if config_file else None
+        self.chunksize = chunksize
+        self.primary_key = primary_key
         self.df = None
+        self.chunks = None
         self.column_mapping = {}
+        # Input size from validate_input_file's stat, reused by read_csv
+        self._input_size = None
+        # Format each date column was parsed with, filled in by parse_dates
+        self.date_formats = {}
         
     def validate_input_file(self) -> bool:
         """Validate that the input file exists and is readable."""
-        if not self.input_file.exists():
+        # A single stat call answers both "exists" and "is a regular file"
+        try:
+            st = self.input_file.stat()
+        except FileNotFoundError:
             logger.error(f"Input file not found: {self.input_file}")
             return False
+        except OSError as e:
+            logger.error(f"Cannot access input file: {e}")
+            return False
         if not self.input_file.suffix.lower() == '.csv':
             logger.error(f"File must be a CSV file. Got: {self.input_file.suffix}")
             return False
-        if not self.input_file.is_file():
+        if not stat.S_ISREG(st.st_mode):
             logger.error(f"Input path is not a file: {self.input_file}")
             return False
-        logger.info(f"Input file validated: {self.input_file}")
+        self._input_size = st.st_size
+        logger.info(f"Input file validated: {self.input_file} ({st.st_size / 1024:.2f} KB)")
         return True
     
     def set_default_output_file(self):
@@ -62,10 +300,10 @@ class CSVtoExcelConverter:
         """Load column mapping from config file if provided."""
         if self.config_file and self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    self.column_mapping = json.load(f)
+                data = self.config_file.read_bytes()
+                self.column_mapping = orjson.loads(data) if orjson else json.loads(data)
                 logger.info(f"Column mapping loaded from {self.config_file}")
-                logger.debug(f"Mapping: {self.column_mapping}")
+                logger.debug("Mapping: %s", self.column_mapping)
             except json.JSONDecodeError as e:
                 logger.error(f"Invalid JSON in config file: {e}")
                 return False
@@ -87,9 +325,24 @@ class CSVtoExcelConverter:
         """
         try:
             logger.info(f"Reading CSV file: {self.input_file}")
-            self.df = pd.read_csv(self.input_file, encoding=encoding, skiprows=skip_rows)
-            logger.info(f"Successfully read {len(self.df)} rows and {len(self.df.columns)} columns")
-            logger.debug(f"Columns: {list(self.df.columns)}")
+            # An empty file cannot be mapped; reading it normally lets pandas
+            # report EmptyDataError as before. The size comes from
+            # validate_input_file, so an unvalidated file is not mapped.
+            memory_map = bool(self._input_size)
+            if self.chunksize:
+                self.chunks = pd.read_csv(self.input_file, encoding=encoding, skiprows=skip_rows,
+                                          chunksize=self.chunksize, memory_map=memory_map)
+                logger.info(f"Streaming CSV in chunks of {self.chunksize} rows")
+                return True
+            self.df = self._read_csv_arrow(encoding, skip_rows) if pa_csv is not None else None
+            if self.df is None:
+                # memory_map avoids many small buffered reads on large files
+                self.df = pd.read_csv(self.input_file, encoding=encoding, skiprows=skip_rows,
+                                      memory_map=memory_map, low_memory=False)
+            rows, cols = self.df.shape
+            logger.info(f"Successfully read {rows} rows and {cols} columns")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Columns: %s", list(self.df.columns))
             return True
         except UnicodeDecodeError as e:
             logger.error(f"Encoding error. Try a different encoding: {e}")
@@ -104,6 +357,47 @@ class CSVtoExcelConverter:
             logger.error(f"Failed to read CSV file: {e}")
             return False
     
+    def _read_csv_arrow(self, encoding: str, skip_rows: int) -> Optional[pd.DataFrame]:
+        """
+        Read the CSV with the multi-threaded Arrow parser.
+        
+        The result matches pd.read_csv: duplicate headers are renamed,
+        date/time-like text is left as text for parse_dates to decide on,
+        and empty cells are missing. Returns None when Arrow cannot give
+        the same result, so the caller falls back to the pandas parser
+        (which also reports encoding and parsing errors).
+        """
+        path = str(self.input_file)
+        try:
+            # Header names and types inferred from the first block only,
+            # to learn which columns Arrow would turn into dates or times
+            with pa_csv.open_csv(path, read_options=pa_csv.ReadOptions(
+                    encoding=encoding, skip_rows=skip_rows)) as reader:
+                schema = reader.schema
+            names = _dedupe_column_names(schema.names)
+            as_text = {name: pa.string() for name, field in zip(names, schema)
+                       if pa.types.is_temporal(field.type)}
+            read_options = pa_csv.ReadOptions(encoding=encoding, skip_rows=skip_rows + 1,
+                                              column_names=names)
+            # Treat empty text cells as missing, like pd.read_csv does
+            convert_options = pa_csv.ConvertOptions(strings_can_be_null=True,
+                                                    column_types=as_text)
+            table = pa_csv.read_csv(path, read_options=read_options,
+                                    convert_options=convert_options)
+        except pa.ArrowInvalid:
+            return None
+        
+        # Bytes mean the text was not valid in this encoding; temporal types
+        # mean a column only looked like dates after the first block
+        if any(pa.types.is_binary(t) or pa.types.is_temporal(t) for t in table.schema.types):
+            return None
+        
+        # Keep text as Arrow-backed strings (contiguous UTF-8 buffers
+        # instead of one Python object per cell)
+        arrow_strings = {pa.string(): pd.StringDtype('pyarrow'),
+                         pa.large_string(): pd.StringDtype('pyarrow')}
+        return table.to_pandas(types_mapper=arrow_strings.get)
+    
     def handle_missing_values(self, strategy: str = 'show', fill_value=None, 
                               forward_fill: bool = False) -> bool:
         """
@@ -121,8 +415,10 @@ class CSVtoExcelConverter:
             logger.error("No data loaded. Read CSV first.")
             return False
         
-        missing_summary = self.df.isnull().sum()
-        missing_total = missing_summary.sum()
+        # Build the null mask once; it is reused for the summary and for 'drop'
+        mask = self.df.isna()
+        missing_summary = mask.sum(axis=0)
+        missing_total = int(missing_summary.sum())
         
         if missing_total > 0:
             logger.warning(f"Found {missing_total} missing values:")
@@ -132,17 +428,17 @@ class CSVtoExcelConverter:
             if strategy.lower() == 'show':
                 logger.info("Keeping missing values in output")
             elif strategy.lower() == 'drop':
-                initial_rows = len(self.df)
-                self.df.dropna(inplace=True)
-                logger.info(f"Dropped {initial_rows - len(self.df)} rows with missing values")
+                initial_rows = self.df.shape[0]
+                self.df = self.df.loc[~mask.any(axis=1)]
+                logger.info(f"Dropped {initial_rows - self.df.shape[0]} rows with missing values")
             elif strategy.lower() == 'fill':
                 if fill_value is None:
                     logger.warning("No fill_value provided, using strategy='show' instead")
                 else:
-                    self.df.fillna(fill_value, inplace=True)
+                    self.df = self.df.fillna(fill_value)
                     logger.info(f"Filled missing values with: {fill_value}")
             elif strategy.lower() == 'forward_fill':
-                self.df.fillna(method='ffill', inplace=True)
+                self.df = self.df.ffill()
                 logger.info("Applied forward fill to missing values")
         else:
             logger.info("No missing values found")
@@ -150,13 +446,15 @@ class CSVtoExcelConverter:
         return True
     
     def parse_dates(self, date_columns: Optional[list] = None, 
-                    infer_datetime_format: bool = True) -> bool:
+                    date_format: Optional[str] = None) -> bool:
         """
         Parse date columns.
         
         Args:
             date_columns: List of column names to parse as dates
-            infer_datetime_format: Whether to infer datetime format
+            date_format: strftime format of the dates (default: sniffed per column)
+            
+        The format used for each parsed column is recorded in self.date_formats.
             
         Returns:
             bool: True if successful
@@ -169,11 +467,7 @@ class CSVtoExcelConverter:
             if date_columns:
                 for col in date_columns:
                     if col in self.df.columns:
-                        self.df[col] = pd.to_datetime(
-                            self.df[col], 
-                            infer_datetime_format=infer_datetime_format,
-                            errors='coerce'
-                        )
+                        self.df[col], self.date_formats[col] = self._to_datetime(self.df[col], date_format)
                         logger.info(f"Parsed dates in column: {col}")
                     else:
                         logger.warning(f"Column not found for date parsing: {col}")
@@ -181,9 +475,14 @@ class CSVtoExcelConverter:
                 # Auto-detect and parse date columns
                 for col in self.df.columns:
                     try:
-                        parsed = pd.to_datetime(self.df[col], infer_datetime_format=True, errors='coerce')
+                        # Inside the try: a repeated header gives a DataFrame
+                        # here, and that column is skipped like any other failure
+                        if not self._looks_like_dates(self.df[col]):
+                            continue
+                        parsed, fmt = self._to_datetime(self.df[col], date_format)
                         if parsed.notna().sum() > 0:
                             self.df[col] = parsed
+                            self.date_formats[col] = fmt
                             logger.info(f"Auto-detected and parsed dates in column: {col}")
                     except:
                         pass
@@ -192,6 +491,52 @@ class CSVtoExcelConverter:
             logger.error(f"Error parsing dates: {e}")
             return False
     
+    @staticmethod
+    def _infer_date_format(series: pd.Series) -> Optional[str]:
+        """
+        Return the first DATE_FORMATS entry that fits a sample of the column,
+        else the format pandas would guess from its first value.
+        """
+        sample = [str(value) for value in series.dropna().head(DATE_SAMPLE_SIZE)]
+        if not sample:
+            return None
+        for fmt in DATE_FORMATS:
+            try:
+                for value in sample:
+                    datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+            return fmt
+        if guess_datetime_format is not None:
+            return guess_datetime_format(sample[0])
+        return None
+    
+    @classmethod
+    def _to_datetime(cls, series: pd.Series, date_format: Optional[str] = None) -> tuple:
+        """
+        Convert a column to datetimes, using an explicit format when one is known.
+        
+        Returns:
+            tuple: (parsed series, format used or None if pandas had to guess)
+        """
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return series, date_format
+        fmt = date_format or cls._infer_date_format(series)
+        if fmt:
+            return pd.to_datetime(series, format=fmt, errors='coerce', cache=True), fmt
+        return pd.to_datetime(series, errors='coerce', cache=True), None
+    
+    @staticmethod
+    def _looks_like_dates(series: pd.Series) -> bool:
+        """Check a sample of a text column against DATE_PATTERN."""
+        if not pd.api.types.is_string_dtype(series.dtype):
+            return False
+        sample = series.dropna().head(DATE_SAMPLE_SIZE)
+        if sample.empty:
+            return False
+        matches = sum(1 for value in sample if DATE_PATTERN.match(str(value)))
+        return matches / len(sample) >= DATE_MATCH_RATIO
+    
     def rename_columns(self, custom_mapping: Optional[Dict] = None) -> bool:
         """
         Rename columns using provided mapping or config file.
@@ -210,10 +555,11 @@ class CSVtoExcelConverter:
         
         if mapping:
             try:
-                self.df.rename(columns=mapping, inplace=True)
+                self.df = self.df.rename(columns=mapping)
                 logger.info(f"Renamed {len(mapping)} columns")
-                for old, new in mapping.items():
-                    logger.debug(f"  {old} -> {new}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for old, new in mapping.items():
+                        logger.debug("  %s -> %s", old, new)
                 return True
             except Exception as e:
                 logger.error(f"Error renaming columns: {e}")
@@ -239,30 +585,85 @@ class CSVtoExcelConverter:
             return False
         
         try:
-            original_cols = list(self.df.columns)
+            original_cols = self.df.columns
+            new_cols = original_cols
             
             if strip_whitespace:
-                self.df.columns = self.df.columns.str.strip()
+                new_cols = new_cols.str.strip()
             
             if lowercase:
-                self.df.columns = self.df.columns.str.lower()
+                new_cols = new_cols.str.lower()
             
-            new_cols = list(self.df.columns)
-            if original_cols != new_cols:
+            if (original_cols != new_cols).any():
+                self.df.columns = new_cols
                 logger.info("Column names cleaned")
-                logger.debug(f"Changes: {[(o, n) for o, n in zip(original_cols, new_cols) if o != n]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Changes: %s", [(o, n) for o, n in zip(original_cols, new_cols) if o != n])
             
             return True
         except Exception as e:
             logger.error(f"Error cleaning column names: {e}")
             return False
     
+    def normalize_columns(self, strip_whitespace: bool = True,
+                          lowercase: bool = False,
+                          custom_mapping: Optional[Dict] = None) -> bool:
+        """
+        Clean and rename columns in a single pass.
+        
+        Equivalent to clean_column_names() followed by rename_columns(), but
+        computes the final names up front and rebuilds the column index once.
+        
+        Args:
+            strip_whitespace: Remove leading/trailing whitespace
+            lowercase: Convert column names to lowercase
+            custom_mapping: Optional dictionary of {old_name: new_name}
+            
+        Returns:
+            bool: True if successful
+        """
+        if self.df is None:
+            logger.error("No data loaded. Read CSV first.")
+            return False
+        
+        mapping = custom_mapping or self.column_mapping
+        
+        try:
+            original_cols = list(self.df.columns)
+            cleaned_cols = []
+            for col in original_cols:
+                if isinstance(col, str):
+                    if strip_whitespace:
+                        col = col.strip()
+                    if lowercase:
+                        col = col.lower()
+                cleaned_cols.append(col)
+            new_cols = [mapping.get(col, col) for col in cleaned_cols]
+            
+            if new_cols != original_cols:
+                self.df.columns = new_cols
+            
+            if cleaned_cols != original_cols:
+                logger.info("Column names cleaned")
+            renamed = sum(1 for old, new in zip(cleaned_cols, new_cols) if old != new)
+            if mapping:
+                logger.info(f"Renamed {renamed} columns")
+            else:
+                logger.info("No column mapping provided, skipping rename")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Changes: %s", [(o, n) for o, n in zip(original_cols, new_cols) if o != n])
+            return True
+        except Exception as e:
+            logger.error(f"Error normalizing column names: {e}")
+            return False
+    
     def remove_duplicates(self, subset: Optional[list] = None) -> bool:
         """
         Remove duplicate rows.
         
         Args:
             subset: Column names to consider for identifying duplicates
+                (default: the converter's primary_key, else all columns)
             
         Returns:
             bool: True if successful
@@ -271,10 +672,16 @@ class CSVtoExcelConverter:
             logger.error("No data loaded. Read CSV first.")
             return False
         
+        subset = subset or self.primary_key
+        num_cols = self.df.shape[1]
+        if subset is None and num_cols > WIDE_TABLE_COLUMNS:
+            logger.warning(f"Checking duplicates across all {num_cols} columns; "
+                           f"pass a primary key to only compare the identifying columns")
+        
         try:
-            initial_rows = len(self.df)
-            self.df.drop_duplicates(subset=subset, inplace=True)
-            removed = initial_rows - len(self.df)
+            initial_rows = self.df.shape[0]
+            self.df = self.df.drop_duplicates(subset=subset, ignore_index=True)
+            removed = initial_rows - self.df.shape[0]
             
             if removed > 0:
                 logger.info(f"Removed {removed} duplicate rows")
@@ -288,7 +695,8 @@ class CSVtoExcelConverter:
     
     def export_to_excel(self, sheet_name: str = 'Data', 
                        include_index: bool = False,
-                       freeze_panes: tuple = (1, 0)) -> bool:
+                       freeze_panes: tuple = (1, 0),
+                       engine: str = 'openpyxl') -> bool:
         """
         Export data to Excel file.
         
@@ -296,6 +704,7 @@ class CSVtoExcelConverter:
             sheet_name: Name of the Excel sheet
             include_index: Whether to include the index column
             freeze_panes: Tuple (row, col) for freezing panes
+            engine: 'openpyxl' (default) or 'fast_xml' for very large exports
             
         Returns:
             bool: True if successful
@@ -304,25 +713,43 @@ class CSVtoExcelConverter:
             logger.error("No data loaded. Read CSV first.")
             return False
         
+        if engine not in EXCEL_ENGINES:
+            logger.error(f"Unknown Excel engine: {engine}")
+            return False
+        
+        # Checked here for both engines: fast_xml writes the name unvalidated
+        if len(sheet_name) > MAX_SHEET_NAME_LENGTH or INVALID_TITLE_REGEX.search(sheet_name):
+            logger.error(f"Invalid sheet name {sheet_name!r}: use at most "
+                         f"{MAX_SHEET_NAME_LENGTH} characters and none of [ ] : * ? / \\")
+            return False
+        
         try:
             # Create output directory if it doesn't exist
             self.output_file.parent.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"Exporting to Excel: {self.output_file}")
             
-            with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
-                self.df.to_excel(writer, sheet_name=sheet_name, index=include_index)
-                
-                # Freeze panes if openpyxl is available
-                if freeze_panes and freeze_panes != (0, 0):
-                    try:
-                        from openpyxl import load_workbook
-                        workbook = writer.book
-                        worksheet = writer.sheets[sheet_name]
-                        worksheet.freeze_panes = f'{freeze_panes[0] + 1}{chr(65 + freeze_panes[1])}'
-                        logger.debug(f"Froze panes at {freeze_panes}")
-                    except Exception as e:
-                        logger.warning(f"Could not freeze panes: {e}")
+            if engine == 'fast_xml':
+                self._write_fast_xml(sheet_name, include_index, freeze_panes or (0, 0))
+                logger.info(f"Successfully exported to {self.output_file}")
+                logger.info(f"File size: {self.output_file.stat().st_size / 1024:.2f} KB")
+                return True
+            
+            # Write-only mode streams rows straight to disk instead of
+            # building a styled Cell object for every value
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet(sheet_name)
+            
+            # Panes must be set before the first row is written
+            if freeze_panes and freeze_panes != (0, 0):
+                worksheet.freeze_panes = f'{get_column_letter(freeze_panes[1] + 1)}{freeze_panes[0] + 1}'
+                logger.debug("Froze panes at %s", freeze_panes)
+            
+            worksheet.append(self._header_row(self.df, include_index))
+            for row in self._iter_rows(self.df, include_index):
+                worksheet.append(row)
+            
+            workbook.save(self.output_file)
             
             logger.info(f"Successfully exported to {self.output_file}")
             logger.info(f"File size: {self.output_file.stat().st_size / 1024:.2f} KB")
@@ -331,10 +758,138 @@ class CSVtoExcelConverter:
             logger.error(f"Failed to export to Excel: {e}")
             return False
     
+    def _write_fast_xml(self, sheet_name: str, include_index: bool,
+                        freeze_panes: tuple):
+        """Write the DataFrame as a minimal xlsx package without openpyxl."""
+        with zipfile.ZipFile(self.output_file, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+            archive.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+            archive.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(name=quoteattr(sheet_name)))
+            archive.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+            archive.writestr('xl/styles.xml', _XLSX_STYLES)
+            
+            with archive.open('xl/worksheets/sheet1.xml', 'w') as raw:
+                sheet = io.TextIOWrapper(raw, encoding='utf-8')
+                sheet.write(_XLSX_SHEET_START)
+                sheet.write(_xml_sheet_views(freeze_panes))
+                sheet.write('<sheetData><row>')
+                sheet.write(''.join(map(_xml_cell, self._header_row(self.df, include_index))))
+                sheet.write('</row>')
+                for row in self._iter_rows(self.df, include_index):
+                    sheet.write('<row>' + ''.join(map(_xml_cell, row)) + '</row>')
+                sheet.write(_XLSX_SHEET_END)
+                sheet.close()
+    
+    @staticmethod
+    def _header_row(df: pd.DataFrame, include_index: bool = False) -> list:
+        """Column headers, led by the index name (empty if unnamed) when included."""
+        header = list(df.columns)
+        if include_index:
+            header.insert(0, df.index.name)
+        return header
+    
+    @staticmethod
+    def _iter_rows(df: pd.DataFrame, include_index: bool = False):
+        """Yield DataFrame rows as tuples, with missing values as None."""
+        for start in range(0, len(df), EXPORT_SLICE_ROWS):
+            part = df.iloc[start:start + EXPORT_SLICE_ROWS]
+            values = part.astype(object).where(part.notna(), None)
+            yield from values.itertuples(index=include_index, name=None)
+    
+    def convert_chunks(self, missing_value_strategy: str = 'show',
+                       parse_dates_auto: bool = True,
+                       clean_names: bool = True,
+                       remove_dups: bool = False) -> bool:
+        """
+        Clean each chunk read by read_csv and stream it into a write-only workbook.
+        
+        Column cleaning, renaming and date detection are decided on the first
+        chunk and reused for the rest, so only one chunk is held in memory.
+        
+        Args:
+            missing_value_strategy: Strategy for handling missing values
+            parse_dates_auto: Whether to auto-detect and parse dates
+            clean_names: Whether to clean column names
+            remove_dups: Whether to remove duplicate rows (within each chunk)
+            
+        Returns:
+            bool: True if successful
+        """
+        if self.chunks is None:
+            logger.error("No data loaded. Read CSV first.")
+            return False
+        
+        if remove_dups:
+            logger.warning("Streaming mode only removes duplicates within each chunk")
+        
+        with _copy_on_write():
+            try:
+                workbook = Workbook(write_only=True)
+                worksheet = workbook.create_sheet('Data')
+                worksheet.freeze_panes = 'A2'
+                columns = None
+                # Date columns found in the first chunk and the format each was
+                # read with; later chunks reuse it so a column never switches
+                # between e.g. month-first and day-first
+                date_formats = {}
+                self.date_formats = {}
+                total_rows = 0
+                # Last forward-filled row, so 'forward_fill' carries values
+                # across chunk boundaries like it does on the whole frame
+                carry = None
+                
+                for chunk in self.chunks:
+                    self.df = chunk
+                    first_chunk = columns is None
+                    
+                    if first_chunk:
+                        if not self.normalize_columns(strip_whitespace=clean_names):
+                            return False
+                        columns = list(self.df.columns)
+                        worksheet.append(columns)
+                    else:
+                        self.df.columns = columns
+                    
+                    if not self.handle_missing_values(strategy=missing_value_strategy):
+                        return False
+                    
+                    if missing_value_strategy.lower() == 'forward_fill' and len(self.df):
+                        if carry is not None:
+                            self.df = self.df.fillna(carry)
+                        carry = self.df.iloc[-1]
+                    
+                    if parse_dates_auto:
+                        if first_chunk:
+                            if not self.parse_dates():
+                                return False
+                            date_formats = dict(self.date_formats)
+                        else:
+                            for col, fmt in date_formats.items():
+                                if not self.parse_dates([col], fmt):
+                                    return False
+                    
+                    if remove_dups and not self.remove_duplicates():
+                        return False
+                    
+                    for row in self._iter_rows(self.df):
+                        worksheet.append(row)
+                    total_rows += len(self.df)
+                
+                self.output_file.parent.mkdir(parents=True, exist_ok=True)
+                logger.info(f"Exporting to Excel: {self.output_file}")
+                workbook.save(self.output_file)
+                logger.info(f"Successfully exported {total_rows} rows to {self.output_file}")
+                logger.info(f"File size: {self.output_file.stat().st_size / 1024:.2f} KB")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to convert CSV in chunks: {e}")
+                return False
+    
     def convert(self, missing_value_strategy: str = 'show', 
                 parse_dates_auto: bool = True,
                 clean_names: bool = True,
-                remove_dups: bool = False) -> bool:
+                remove_dups: bool = False,
+                engine: str = 'openpyxl') -> bool:
         """
         Execute the complete conversion process.
         
@@ -343,47 +898,60 @@ class CSVtoExcelConverter:
             parse_dates_auto: Whether to auto-detect and parse dates
             clean_names: Whether to clean column names
             remove_dups: Whether to remove duplicate rows
+            engine: Excel writer engine, 'openpyxl' or 'fast_xml'
             
         Returns:
             bool: True if successful
         """
-        logger.info("=" * 60)
-        logger.info("Starting CSV to Excel Conversion")
-        logger.info("=" * 60)
-        
-        if not self.validate_input_file():
-            return False
-        
-        self.set_default_output_file()
-        
-        if not self.load_column_mapping():
-            return False
-        
-        if not self.read_csv():
-            return False
-        
-        if clean_names and not self.clean_column_names(strip_whitespace=True):
-            return False
-        
-        if not self.handle_missing_values(strategy=missing_value_strategy):
-            return False
-        
-        if parse_dates_auto and not self.parse_dates():
-            return False
-        
-        if not self.rename_columns():
-            return False
-        
-        if remove_dups and not self.remove_duplicates():
-            return False
-        
-        if not self.export_to_excel():
-            return False
-        
-        logger.info("=" * 60)
-        logger.info("Conversion completed successfully!")
-        logger.info("=" * 60)
-        return True
+        with _copy_on_write():
+            logger.info("=" * 60)
+            logger.info("Starting CSV to Excel Conversion")
+            logger.info("=" * 60)
+            
+            if not self.validate_input_file():
+                return False
+            
+            self.set_default_output_file()
+            
+            if not self.load_column_mapping():
+                return False
+            
+            if not self.read_csv():
+                return False
+            
+            if self.chunksize:
+                if engine != 'openpyxl':
+                    logger.warning(f"Engine '{engine}' is not supported with chunksize; "
+                                   "streaming through openpyxl instead")
+                if not self.convert_chunks(missing_value_strategy=missing_value_strategy,
+                                           parse_dates_auto=parse_dates_auto,
+                                           clean_names=clean_names,
+                                           remove_dups=remove_dups):
+                    return False
+                logger.info("=" * 60)
+                logger.info("Conversion completed successfully!")
+                logger.info("=" * 60)
+                return True
+            
+            if not self.normalize_columns(strip_whitespace=clean_names):
+                return False
+            
+            if not self.handle_missing_values(strategy=missing_value_strategy):
+                return False
+            
+            if parse_dates_auto and not self.parse_dates():
+                return False
+            
+            if remove_dups and not self.remove_duplicates():
+                return False
+            
+            if not self.export_to_excel(engine=engine):
+                return False
+            
+            logger.info("=" * 60)
+            logger.info("Conversion completed successfully!")
+            logger.info("=" * 60)
+            return True
 
 
 def main():
@@ -457,6 +1025,28 @@ Examples:
         help='Remove duplicate rows'
     )
     
+    parser.add_argument(
+        '-k', '--key',
+        nargs='+',
+        dest='primary_key',
+        metavar='COLUMN',
+        help='Column(s) that identify a row when removing duplicates (default: all columns)'
+    )
+    
+    parser.add_argument(
+        '--engine',
+        choices=EXCEL_ENGINES,
+        default='openpyxl',
+        help='Excel writer; fast_xml writes the xlsx directly for very large files (default: openpyxl)'
+    )
+    
+    parser.add_argument(
+        '--chunksize',
+        type=int,
+        default=None,
+        help='Stream the CSV in chunks of this many rows to limit memory use'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -471,14 +1061,17 @@ Examples:
     converter = CSVtoExcelConverter(
         input_file=args.input_file,
         output_file=args.output,
-        config_file=args.config
+        config_file=args.config,
+        chunksize=args.chunksize,
+        primary_key=args.primary_key
     )
     
     success = converter.convert(
         missing_value_strategy=args.missing_strategy,
         parse_dates_auto=args.parse_dates,
         clean_names=args.clean_names,
-        remove_dups=args.remove_duplicates
+        remove_dups=args.remove_duplicates,
+        engine=args.engine
     )
     
     sys.exit(0 if success else 1)
@@ -4,6 +4,7 @@ Shows how to use the converter in your own Python scripts.
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from csv_to_excel_converter import CSVtoExcelConverter
 from pathlib import Path
 
@@ -134,6 +135,21 @@ def example_6_custom_processing():
     )
 
 
+def _convert_one(csv_file):
+    """Convert a single CSV file (runs in a worker process for example 7)."""
+    converter = CSVtoExcelConverter(
+        input_file=str(csv_file),
+        output_file=str(csv_file.with_suffix('.xlsx'))
+    )
+    
+    return converter.convert(
+        missing_value_strategy='show',
+        parse_dates_auto=True,
+        clean_names=True,
+        remove_dups=False
+    )
+
+
 def example_7_multiple_files():
     """Example 7: Process multiple CSV files."""
     print("\n" + "="*70)
@@ -147,22 +163,15 @@ def example_7_multiple_files():
         print("No CSV files found in current directory")
         return
     
-    for i, csv_file in enumerate(csv_files, 1):
-        output_file = csv_file.with_suffix('.xlsx')
-        
-        print(f"\nProcessing file {i}/{len(csv_files)}: {csv_file.name}")
-        
-        converter = CSVtoExcelConverter(
-            input_file=str(csv_file),
-            output_file=str(output_file)
-        )
-        
-        converter.convert(
-            missing_value_strategy='show',
-            parse_dates_auto=True,
-            clean_names=True,
-            remove_dups=False
-        )
+    print(f"\nProcessing {len(csv_files)} files in parallel")
+    
+    # Each conversion is independent, so run them in separate processes
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(_convert_one, csv_files))
+    
+    for csv_file, success in zip(csv_files, results):
+        status = "✅" if success else "❌"
+        print(f"{status} {csv_file.name}")
 
 
 def example_8_error_handling():
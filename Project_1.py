@@ -1,29 +1,72 @@
+import ast
+import operator as op
+import re
+from functools import lru_cache, partial
+
+try:
+    import msvcrt
+except ImportError:  # msvcrt is Windows-only; fall back to input()
+    msvcrt = None
+
+_OPS = {
+    ast.Add: op.add,
+    ast.Sub: op.sub,
+    ast.Mult: op.mul,
+    ast.Div: op.truediv,
+    ast.FloorDiv: op.floordiv,
+    ast.Pow: op.pow,
+    ast.USub: op.neg,
+    ast.UAdd: op.pos,
+}
+
+_VALID_RE = re.compile(r'\A[0-9.+\-*/ ]*\Z')
+
+def _eval_node(node):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPS:
+        return _OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _OPS:
+        return _OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+@lru_cache(maxsize=256)
+def _compile(expression):
+    tree = ast.parse(expression.strip(), mode='eval')
+    return partial(_eval_node, tree.body)
+
 def is_input_valid(expression):
-    valid_chars = "0123456789.+-*/ "
-    for char in expression:
-        if char not in valid_chars:
-            return False
-    return True
+    return _VALID_RE.match(expression) is not None
 
 def calculate_expression(expression):
     if not is_input_valid(expression):
         return " invalid operator detected, can't perform calculation"
 
     try:
-        return eval(expression)
+        return _compile(expression)()
     except ZeroDivisionError:
         return "Error: Division by zero is not allowed"
     except Exception:
         return "Error: Invalid calculation format"
 
+_MENU = "\nCalculator Menu\nSupported Operators: +, -, *, /\n"
+
 def show_menu():
-    print("")
-    print("Calculator Menu")
-    print("Supported Operators: +, -, *, /")
-    print("")
+    print(_MENU)
 
+def wait_for_next():
+    # Returns False when the user chooses to exit
+    if msvcrt is None:
+        answer = input("Press Enter for new calculation, or type 'q' to exit: ")
+        return answer.strip().lower() != 'q'
 
-import msvcrt
+    print("new calculation (Press Enter for new calculation, Esc to exit)")
+    while True:
+        key = msvcrt.getch()
+        if key == b'\r':
+            return True
+        if key == b'\x1b':
+            return False
 
 def run():
     show_menu()
@@ -37,15 +80,10 @@ def run():
 
         result = calculate_expression(user_input)
         print("Result:", result)
-        print("new calculation (Press Enter for new calculation, Esc to exit)")
-
-        while True:
-            key = msvcrt.getch()
-            if key == b'\r':
-                break
-            elif key == b'\x1b':
-                print("Exiting calculator.")
-                return
+
+        if not wait_for_next():
+            print("Exiting calculator.")
+            return
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -1,12 +1,26 @@
+import argparse
+import atexit
 import json
+import operator
 import os
+import sys
+
+_ROW_FMT = "{:<10} {:<30} {:<20} {:<10}".format
+# Field order of a book stored as a JSON array in books.json
+_BOOK_FIELDS = operator.attrgetter('title', 'author', 'book_id', 'issued')
+
 
 class Book:
+    __slots__ = ('title', 'author', 'book_id', 'issued', '_title_lc', '_author_lc')
+
     def __init__(self, title, author, book_id, issued=False):
         self.title = title
         self.author = author
         self.book_id = book_id
         self.issued = issued
+        # Case-folded copies used by Library.search_books
+        self._title_lc = title.casefold()
+        self._author_lc = author.casefold()
 
     def to_dict(self):
         return {
@@ -18,47 +32,69 @@ class Book:
 
     @staticmethod
     def from_dict(data):
+        # Compact saves store each book as a [title, author, book_id, issued] array
+        if isinstance(data, list):
+            return Book(*data)
         return Book(data['title'], data['author'], data['book_id'], data.get('issued', False))
 
 class Library:
-    def __init__(self, filename='books.json'):
+    def __init__(self, filename='books.json', pretty=False):
         self.filename = filename
-        self.books = self.load_books()
-        self.book_dict = {b.book_id: b for b in self.books}
+        self.pretty = pretty
+        self.book_dict = self.load_books()
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
 
     def load_books(self):
         if not os.path.exists(self.filename):
-            return []
+            return {}
         with open(self.filename, 'r') as f:
             try:
                 data = json.load(f)
-                return [Book.from_dict(b) for b in data]
             except json.JSONDecodeError:
-                return []
+                return {}
+        books = map(Book.from_dict, data)
+        return {b.book_id: b for b in books}
 
-    def save_books(self):
-        with open(self.filename, 'w') as f:
-            json.dump([b.to_dict() for b in self.books], f, indent=2)
+    def save_books(self, pretty=False):
+        if pretty:
+            data = [b.to_dict() for b in self.book_dict.values()]
+            payload = json.dumps(data, indent=2)
+        else:
+            data = list(map(_BOOK_FIELDS, self.book_dict.values()))
+            payload = json.dumps(data, separators=(',', ':'))
+        tmp = self.filename + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(payload)
+        os.replace(tmp, self.filename)
+        self._dirty = False
+
+    def flush(self):
+        if self._dirty:
+            self.save_books(self.pretty)
 
     def add_book(self, title, author, book_id):
         if book_id in self.book_dict:
             print(f"Error: Book ID '{book_id}' already exists.")
             return False
         book = Book(title, author, book_id)
-        self.books.append(book)
         self.book_dict[book_id] = book
-        self.save_books()
+        self._dirty = True
         print(f"Book '{title}' added.")
         return True
 
     def search_books(self, query, by='title'):
-        results = []
-        for b in self.books:
-            if by == 'title' and query.lower() in b.title.lower():
-                results.append(b)
-            elif by == 'author' and query.lower() in b.author.lower():
-                results.append(b)
-        return results
+        q = query.casefold()
+        if by == 'title':
+            return [b for b in self.book_dict.values() if q in b._title_lc]
+        if by == 'author':
+            return [b for b in self.book_dict.values() if q in b._author_lc]
+        return []
 
     def issue_book(self, book_id):
         book = self.book_dict.get(book_id)
@@ -69,7 +105,7 @@ class Library:
             print(f"Error: Book '{book.title}' is already issued.")
             return False
         book.issued = True
-        self.save_books()
+        self._dirty = True
         print(f"Book '{book.title}' issued.")
         return True
 
@@ -82,39 +118,49 @@ class Library:
             print(f"Error: Book '{book.title}' is not issued.")
             return False
         book.issued = False
-        self.save_books()
+        self._dirty = True
         print(f"Book '{book.title}' returned.")
         return True
 
     def report(self):
-        total = len(self.books)
-        issued = sum(1 for b in self.books if b.issued)
+        total = len(self.book_dict)
+        issued = sum(1 for b in self.book_dict.values() if b.issued)
         print(f"Total books: {total}")
         print(f"Issued books: {issued}")
         print(f"Available books: {total - issued}")
 
     def list_books(self):
-        if not self.books:
+        if not self.book_dict:
             print("No books found.")
             return
-        print("{:<10} {:<30} {:<20} {:<10}".format("ID", "Title", "Author", "Issued"))
-        print("-"*75)
-        for b in self.books:
-            print("{:<10} {:<30} {:<20} {:<10}".format(b.book_id, b.title, b.author, "Yes" if b.issued else "No"))
+        out = [_ROW_FMT("ID", "Title", "Author", "Issued"), "-"*75]
+        out.extend(_ROW_FMT(b.book_id, b.title, b.author, "Yes" if b.issued else "No")
+                   for b in self.book_dict.values())
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+_MENU = "\n".join([
+    "\nLibrary Manager",
+    "1. Add Book",
+    "2. Search Book by Title",
+    "3. Search Book by Author",
+    "4. Issue Book",
+    "5. Return Book",
+    "6. List Books",
+    "7. Report",
+    "8. Exit",
+])
 
 
 def main():
-    library = Library()
+    parser = argparse.ArgumentParser(description='Manage a small library of books.')
+    parser.add_argument('--pretty', action='store_true', help='Write books.json indented for reading')
+    args = parser.parse_args()
+    library = Library(pretty=args.pretty)
+    # Save pending changes even if the session ends on Ctrl+C or EOF
+    atexit.register(library.flush)
     while True:
-        print("\nLibrary Manager")
-        print("1. Add Book")
-        print("2. Search Book by Title")
-        print("3. Search Book by Author")
-        print("4. Issue Book")
-        print("5. Return Book")
-        print("6. List Books")
-        print("7. Report")
-        print("8. Exit")
+        print(_MENU)
         choice = input("Select an option (1-8): ")
         if choice == '1':
             title = input("Enter title: ")
@@ -152,6 +198,7 @@ def main():
             break
         else:
             print("Invalid option. Try again.")
+        library.flush()
 
 if __name__ == "__main__":
     main()
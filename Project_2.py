@@ -23,11 +23,12 @@ def play_game(max_range):
     while True:
         user_input = input("Enter your guess: ")
         
-        if not user_input.isdigit():
+        try:
+            guess = int(user_input.strip())
+        except ValueError:
             print("Invalid input. Please enter a number.")
             continue
             
-        guess = int(user_input)
         attempts += 1
         
         if guess < target:
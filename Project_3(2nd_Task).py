@@ -1,43 +1,74 @@
 import os
-import shutil
 import logging
 import argparse
 from datetime import datetime
 
+_log = logging.getLogger('file_move')
+
 def setup_logger(logfile):
-    logging.basicConfig(
-        filename=logfile,
-        level=logging.INFO,
-        format='%(asctime)s - %(message)s'
-    )
-
-def get_unique_filename(dest_folder, filename):
-    base, ext = os.path.splitext(filename)
+    # Safe to call repeatedly: a handler is only attached once per log file
+    logpath = os.path.abspath(logfile)
+    for handler in _log.handlers:
+        if isinstance(handler, logging.FileHandler) and handler.baseFilename == logpath:
+            return
+    handler = logging.FileHandler(logpath)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+    _log.addHandler(handler)
+    _log.setLevel(logging.INFO)
+
+def index_folder(folder):
+    # Names already in folder, normalised for case-insensitive filesystems
+    try:
+        with os.scandir(folder) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def split_extension(filename):
+    # Same split as os.path.splitext for a bare file name: leading dots
+    # (".bashrc", "..x") belong to the base, not the extension
+    base, dot, suffix = filename.rpartition('.')
+    if not base.lstrip('.'):
+        return filename, ''
+    return base, dot + suffix
+
+def get_unique_filename(existing_names, filename, base, ext):
     counter = 1
     new_filename = filename
-    while os.path.exists(os.path.join(dest_folder, new_filename)):
+    while os.path.normcase(new_filename) in existing_names:
         new_filename = f"{base}_{counter}{ext}"
         counter += 1
+    existing_names.add(os.path.normcase(new_filename))
     return new_filename
 
 def move_files_by_extension(folder, dry_run=False, logfile='file_move.log'):
-    setup_logger(logfile)
-    for fname in os.listdir(folder):
-        fpath = os.path.join(folder, fname)
-        if os.path.isfile(fpath):
-            ext = os.path.splitext(fname)[1][1:] or 'no_ext'
-            dest_folder = os.path.join(folder, ext)
-            if not os.path.exists(dest_folder):
-                if not dry_run:
-                    os.makedirs(dest_folder)
-            unique_name = get_unique_filename(dest_folder, fname)
-            dest_path = os.path.join(dest_folder, unique_name)
-            if dry_run:
-                print(f"[DRY RUN] Would move: {fpath} -> {dest_path}")
-            else:
-                shutil.move(fpath, dest_path)
-                logging.info(f"Moved: {fpath} -> {dest_path}")
-                print(f"Moved: {fpath} -> {dest_path}")
+    if logfile:
+        setup_logger(logfile)
+    dest_indexes = {}
+    # scandir reports the entry type from the directory listing itself, so
+    # regular files need no extra stat; the list is taken up front because
+    # the loop adds subfolders to the directory being scanned
+    with os.scandir(folder) as entries:
+        files = [entry for entry in entries if entry.is_file()]
+    for entry in files:
+        fname = entry.name
+        fpath = entry.path
+        base, ext = split_extension(fname)
+        dest_folder = os.path.join(folder, ext[1:] or 'no_ext')
+        existing_names = dest_indexes.get(dest_folder)
+        if existing_names is None:
+            existing_names = dest_indexes[dest_folder] = index_folder(dest_folder)
+            if not dry_run:
+                os.makedirs(dest_folder, exist_ok=True)
+        unique_name = get_unique_filename(existing_names, fname, base, ext)
+        dest_path = os.path.join(dest_folder, unique_name)
+        if dry_run:
+            print(f"[DRY RUN] Would move: {fpath} -> {dest_path}")
+        else:
+            # dest_folder lives inside folder, so this is always a same-filesystem rename
+            os.replace(fpath, dest_path)
+            _log.info("Moved: %s -> %s", fpath, dest_path)
+            print(f"Moved: {fpath} -> {dest_path}")
 
 def main():
     parser = argparse.ArgumentParser(description='Move files into subfolders by extension.')
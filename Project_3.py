@@ -1,21 +1,45 @@
+import argparse
 import json
 import os
 
 FILE_NAME = "tasks.json"
 
+# Indentation for tasks.json; None writes compact JSON. Set by --pretty.
+INDENT = None
+
+# Raw bytes of FILE_NAME as last read or written, keyed by (mtime, size).
+# Each load decodes them afresh, so callers never share a list.
+_cache = {'key': None, 'raw': None}
+
+def _file_key():
+    st = os.stat(FILE_NAME)
+    return st.st_mtime_ns, st.st_size
+
 def load_tasks():
-    if not os.path.exists(FILE_NAME):
+    try:
+        key = _file_key()
+    except FileNotFoundError:
         return []
     try:
-        with open(FILE_NAME, 'r') as file:
-            return json.load(file)
+        if key != _cache['key']:
+            with open(FILE_NAME, 'rb') as file:
+                raw = file.read()
+            _cache['key'], _cache['raw'] = key, raw
+        return json.loads(_cache['raw'])
     except (json.JSONDecodeError, IOError):
         return []
 
 def save_tasks(tasks):
+    tmp = FILE_NAME + '.tmp'
     try:
-        with open(FILE_NAME, 'w') as file:
-            json.dump(tasks, file, indent=4)
+        if INDENT is None:
+            raw = json.dumps(tasks, separators=(',', ':')).encode()
+        else:
+            raw = json.dumps(tasks, indent=INDENT).encode()
+        with open(tmp, 'wb') as file:
+            file.write(raw)
+        os.replace(tmp, FILE_NAME)
+        _cache['key'], _cache['raw'] = _file_key(), raw
     except IOError:
         print("Error saving tasks to file.")
 
@@ -85,16 +109,26 @@ def mark_done(tasks):
     except ValueError:
         print("Please enter a valid number.")
 
+_MENU = "\n".join([
+    "\nTodo List Menu",
+    "1. Add Task",
+    "2. View Tasks",
+    "3. Mark Task Done",
+    "4. Delete Task",
+    "5. Exit",
+])
+
 def main():
+    global INDENT
+    parser = argparse.ArgumentParser(description='Simple todo list manager.')
+    parser.add_argument('--pretty', action='store_true', help='Write tasks.json indented for reading')
+    args = parser.parse_args()
+    if args.pretty:
+        INDENT = 4
     tasks = load_tasks()
     
     while True:
-        print("\nTodo List Menu")
-        print("1. Add Task")
-        print("2. View Tasks")
-        print("3. Mark Task Done")
-        print("4. Delete Task")
-        print("5. Exit")
+        print(_MENU)
         
         choice = input("Choose option (1-5): ").strip()
         